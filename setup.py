@@ -66,6 +66,7 @@ setup(
             "pyconll",
             "pypng",
             "pytest",
+            "python-calamine",
             "PyYAML>=5.1",
             "savReaderWriter @ git+https://github.com/anjakefala/savReaderWriter#egg=savReaderWriter",
             "tabulate",
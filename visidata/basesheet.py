@@ -72,8 +72,7 @@ class DrawablePane(Extensible):
 
         try:
             self.sheet = self
-            code = compile(cmd.execstr, cmd.longname, 'exec')
-            exec(code, vdglobals, LazyChainMap(vd, self))
+            exec(cmd.code, vdglobals, LazyChainMap(vd, self))
             return False
         except EscapeException as e:  # user aborted
             vd.warning(str(e))
@@ -103,7 +102,10 @@ class BaseSheet(DrawablePane):
     guide = ''           # default to show in sidebar
 
     def _obj_options(self):
-        return vd.OptionsObject(vd._options, obj=self)
+        opts = self.__dict__.get('_options')
+        if opts is None:  # create once per sheet; its cache invalidates via the SettingsMgr generation
+            opts = self.__dict__['_options'] = vd.OptionsObject(vd._options, obj=self)
+        return opts
 
     def _class_options(cls):
         return vd.OptionsObject(vd._options, obj=cls)
@@ -140,6 +142,7 @@ class BaseSheet(DrawablePane):
         cls = self.__class__
         ret = cls.__new__(cls)
         ret.__dict__.update(self.__dict__)
+        ret.__dict__.pop('_options', None)  # options context must refer to the copy, not the original
         ret.precious = True  # copy can be precious even if original is not
         ret.hasBeenModified = False  # copy is not modified even if original is
         return ret
@@ -188,7 +191,7 @@ class BaseSheet(DrawablePane):
         return f'**{self.source}**'
 
     def execCommand(self, longname, vdglobals=None, keystrokes=None):
-        if ' ' in longname:
+        if isinstance(longname, str) and ' ' in longname:
             cmd, arg = longname.split(' ', maxsplit=1)
             vd.injectInput(arg)
 
@@ -7,7 +7,16 @@ import textwrap
 from visidata import options, drawcache, vd, update_attr, colors, ColorAttr
 
 disp_column_fill = ' '
-internal_markup_re = r'(\[[:/][^\]]*?\])'  # [:whatever until the closing bracket] or [/whatever] or [:]
+internal_markup_re = re.compile(r'(\[[:/][^\]]*?\])')  # [:whatever until the closing bracket] or [/whatever] or [:]
+
+# markdown -> internal formatting, applied in order by _markdown_to_internal
+_markdown_res = [
+    (re.compile(r'`(.*?)`'), r'[:code]\1[/]'),
+    (re.compile(r'(^#.*?)$'), r'[:heading]\1[/]'),
+    (re.compile(r'\*\*(.*?)\*\*'), r'[:bold]\1[/]'),
+    (re.compile(r'\*(.*?)\*'), r'[:italic]\1[/]'),
+    (re.compile(r'\b_(.*?)_\b'), r'[:underline]\1[/]'),
+]
 
 ### Curses helpers
 
@@ -61,7 +70,7 @@ def is_vdcode(s:str) -> bool:
 def iterchunks(s, literal=False):
     attrstack = [dict(link='', cattr=ColorAttr())]
     legitopens = 0
-    chunks = re.split(internal_markup_re, s)
+    chunks = internal_markup_re.split(s)
     for chunk in chunks:
         if not chunk:
             continue
@@ -284,11 +293,8 @@ def clipdraw_chunks(scr, y, x, chunks, cattr:ColorAttr=ColorAttr(), w=None, clea
 
 def _markdown_to_internal(text):
     'Return markdown-formatted `text` converted to internal formatting (like `[:color]text[/]`).'
-    text = re.sub(r'`(.*?)`', r'[:code]\1[/]', text)
-    text = re.sub(r'(^#.*?)$', r'[:heading]\1[/]', text)
-    text = re.sub(r'\*\*(.*?)\*\*', r'[:bold]\1[/]', text)
-    text = re.sub(r'\*(.*?)\*', r'[:italic]\1[/]', text)
-    text = re.sub(r'\b_(.*?)_\b', r'[:underline]\1[/]', text)
+    for regex, repl in _markdown_res:
+        text = regex.sub(repl, text)
     return text
 
 
@@ -308,7 +314,7 @@ def wraptext(text, width=80, indent=''):
             continue
 
         line = _markdown_to_internal(line)
-        chunks = re.split(internal_markup_re, line)
+        chunks = internal_markup_re.split(line)
         textchunks = [x for x in chunks if not is_vdcode(x)]
         for linenum, textline in enumerate(textwrap.wrap(''.join(textchunks), width=width, drop_whitespace=False)):
             txt = textline
@@ -79,12 +79,11 @@ class ColorMaker:
     def __init__(self):
         self.color_pairs = {}  # (fg,bg) -> (pairnum, colornamestr) (pairnum can be or'ed with other attrs)
         self.color_cache = {}  # colorname -> colorpair
-
-    @drawcache_property
-    def colorcache(self):
-        return {}
+        self.colorcache = {}  # optname -> ColorAttr; persists across frames, cleared on option change
+        self._colorcache_obj = None  # sheet the colorcache was resolved against
 
     def setup(self):
+        self.colorcache.clear()  # colors resolved before curses init may be incomplete
         try:
             curses.use_default_colors()
         except Exception as e:
@@ -115,6 +114,9 @@ class ColorMaker:
     def get_color(self, optname:str, precedence:int=0) -> ColorAttr:
         '''Return ColorAttr for options.color_foo if *optname* of either "foo" or "color_foo",
            Otherwise parse *optname* for colorstring like "bold 34 red on 135 blue".'''
+        if vd.activeSheet is not self._colorcache_obj:  # sheet-specific options may resolve differently
+            self.colorcache.clear()
+            self._colorcache_obj = vd.activeSheet
         r = self.colorcache.get(optname, None)
         if r is None:
             coloropt = vd.options._get(optname) or vd.options._get(f'color_{optname}')
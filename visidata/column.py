@@ -461,17 +461,19 @@ class Column(Extensible):
         'Return the maximum length of any cell in column or its header (up to window width).'
         w = 0
         nlen = dispwidth(self.name)
+        winwidth = self.sheet.windowWidth
         if len(rows) > 0:
             w_max = 0
+            getDisplayValue = self.getDisplayValue
             for r in rows:
-                row_w = dispwidth(self.getDisplayValue(r), maxwidth=self.sheet.windowWidth)
+                row_w = dispwidth(getDisplayValue(r), maxwidth=winwidth)
                 if w_max < row_w:
                     w_max = row_w
-                if w_max >= self.sheet.windowWidth:
+                if w_max >= winwidth:
                     break  #1747  early out to speed up wide columns
             w = w_max
         w = max(w, nlen)+2
-        w = min(w, self.sheet.windowWidth)
+        w = min(w, winwidth)
         return w
 
 
@@ -4,9 +4,11 @@ from visidata import vd, VisiData, Sheet, IndexSheet, SequenceSheet, ColumnItem,
 SPREADSHEET_FIELDS='properties sheets namedRanges spreadsheetUrl developerMetadata dataSources dataSourceSchedules'.split()
 SHEET_FIELDS='merges conditionalFormats filterViews protectedRanges basicFilter charts bandedRanges developerMetadata rowGroups columnGroups slicers'.split()
 
+gsheet_id_re = re.compile(r'([A-z0-9_]{44})')
+
 @VisiData.api
 def open_gsheets(vd, p):
-    m = re.search(r'([A-z0-9_]{44})', p.given)
+    m = gsheet_id_re.search(p.given)
     if m:
         return GSheetsIndex(p.base_stem, source=m.groups()[0])
 
@@ -1,7 +1,6 @@
 import io
 import json
 import socket
-from unittest.mock import Mock
 
 from visidata import vd, VisiData, asyncthread, asyncignore, CommandLogRow, Sheet
 
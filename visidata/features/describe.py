@@ -1,7 +1,7 @@
 from copy import copy
 from statistics import mode, median, mean, stdev
 
-from visidata import vd, Column, ColumnAttr, vlen, RowColorizer, asyncthread, Progress, wrapply
+from visidata import vd, Column, ColumnAttr, vlen, RowColorizer, asyncthread, Progress, wrapply, anytype
 from visidata import BaseSheet, TableSheet, ColumnsSheet, SheetsSheet
 
 
@@ -72,21 +72,25 @@ class DescribeSheet(ColumnsSheet):
             isNull = srccol.sheet.isNullFunc()
 
             vals = list()
-            d['errors'] = list()
-            d['nulls'] = list()
-            d['distinct'] = set()
+            errors = d['errors'] = list()
+            nulls = d['nulls'] = list()
+            distinct = d['distinct'] = set()
+
+            getValue = srccol.getValue
+            totype = None if srccol.type is anytype else srccol.type  # anytype conversion is an identity
 
             for sr in Progress(srccol.sheet.rows, 'calculating'):
                 try:
-                    v = srccol.getValue(sr)
+                    v = getValue(sr)
                     if isNull(v):
-                        d['nulls'].append(sr)
+                        nulls.append(sr)
                     else:
-                        v = srccol.type(v)
+                        if totype:
+                            v = totype(v)
                         vals.append(v)
-                    d['distinct'].add(v)
+                    distinct.add(v)
                 except Exception as e:
-                    d['errors'].append(sr)
+                    errors.append(sr)
 
             d['mode'] = self.calcStatistic(d, mode, vals)
             if vd.isNumeric(srccol):
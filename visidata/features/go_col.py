@@ -7,9 +7,10 @@ from visidata import vd, Sheet, AttrDict, dispwidth
 def nextColRegex(sheet, colregex):
     'Go to first visible column after the cursor matching `colregex`.'
     pivot = sheet.cursorVisibleColIndex
+    regex = re.compile(colregex, sheet.regex_flags())
     for i in itertools.chain(range(pivot+1, len(sheet.visibleCols)), range(0, pivot+1)):
         c = sheet.visibleCols[i]
-        if re.search(colregex, c.name, sheet.regex_flags()):
+        if regex.search(c.name):
             return i
 
     vd.fail('no column name matches /%s/' % colregex)
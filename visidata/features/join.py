@@ -104,28 +104,29 @@ def joinkey(sheetKeyCols, row):
 
 
 def groupRowsByKey(sheets:dict, rowsBySheetKey, rowsByKey):
-    with Progress(gerund='grouping', total=sum(len(vs.rows) for vs in sheets)*2) as prog:
+    with Progress(gerund='grouping', total=sum(len(vs.rows) for vs in sheets)) as prog:
+        keys = []  # distinct keys, in first-seen (sheet, row) order
         for vs in sheets:
-            # tally rows by keys for each sheet
-            rowsBySheetKey[vs] = collections.defaultdict(list)
+            # tally rows by keys for each sheet, computing each key only once
+            rowsBySheetKey[vs] = rowsByKeyThisSheet = collections.defaultdict(list)
+            keycols = sheets[vs]
             for r in vs.rows:
                 prog.addProgress(1)
-                key = joinkey(sheets[vs], r)
-                rowsBySheetKey[vs][key].append(r)
-
-        for vs in sheets:
-            for r in vs.rows:
-                prog.addProgress(1)
-                key = joinkey(sheets[vs], r)
-                if key not in rowsByKey: # gather for this key has not been done yet
-                    # multiplicative for non-unique keys
-                    rowsByKey[key] = [
-                        dict(crow)
-                          for crow in itertools.product(*[
-                              [(vs2, j) for j in rowsBySheetKey[vs2].get(key, [None])]
-                                  for vs2 in sheets
-                          ])
-                    ]
+                key = joinkey(keycols, r)
+                if key not in rowsByKey:
+                    rowsByKey[key] = None  # placeholder to record first-seen order
+                    keys.append(key)
+                rowsByKeyThisSheet[key].append(r)
+
+        for key in keys:
+            # multiplicative for non-unique keys
+            rowsByKey[key] = [
+                dict(crow)
+                  for crow in itertools.product(*[
+                      [(vs2, j) for j in rowsBySheetKey[vs2].get(key, [None])]
+                          for vs2 in sheets
+                  ])
+            ]
 
 
 class JoinKeyColumn(Column):
@@ -76,7 +76,8 @@ def addRegexColumns(vs, regexMaker, origcol, regexstr):
 
 @VisiData.api
 def regexTransform(vd, origcol, before='', after=''):
-    return lambda col,row,origcol=origcol,before=before,after=after,flags=origcol.sheet.regex_flags(): re.sub(before, after, origcol.getDisplayValue(row), flags=flags)
+    regex = re.compile(before, origcol.sheet.regex_flags())
+    return lambda col,row,origcol=origcol,regex=regex,after=after: regex.sub(after, origcol.getDisplayValue(row))
 
 
 @VisiData.api
@@ -0,0 +1,24 @@
+'Fast values-only workbook loading via python-calamine: vd -f calamine file.xlsx'
+
+from visidata import vd, VisiData, IndexSheet, SequenceSheet
+
+
+@VisiData.api
+def open_calamine(vd, p):
+    return CalamineIndexSheet(p.base_stem, source=p)
+
+
+class CalamineIndexSheet(IndexSheet):
+    'Load xlsx/xls/xlsb/ods workbook with the Rust-based calamine parser.  Much faster than openpyxl, but cell values only: no formatting, colors, or cell metadata.'
+    rowtype = 'sheets'  # rowdef: CalamineSheet
+    def iterload(self):
+        calamine = vd.importExternal('python_calamine', 'python-calamine')
+        self.workbook = calamine.CalamineWorkbook.from_path(str(self.source))
+        for name in self.workbook.sheet_names:
+            yield CalamineSheet(self.name, name, source=self.workbook.get_sheet_by_name(name))
+
+
+class CalamineSheet(SequenceSheet):
+    # rowdef: list of native values
+    def iterload(self):
+        yield from self.source.to_python(skip_empty_area=False)
@@ -12,23 +12,27 @@ vd.option('csv_lineterminator', '\r\n', 'lineterminator passed to csv.writer', r
 vd.option('safety_first', False, 'sanitize input/output to handle edge cases, with a performance cost', replay=True)
 
 
+_sniffed_dialects = {}  # [first line] -> csv_* options from a previous sniff
+
 @VisiData.api
 def guess_csv(vd, p):
     import csv
     csv.field_size_limit(2**31-1)  #288 Windows has max 32-bit
-    try:
-        line = next(p.open())
-    except StopIteration:
+    line = p.read_prefix().partition('\n')[0]
+    if not line:
         return
     if ',' in line:
-        dialect = csv.Sniffer().sniff(line)
-        r = dict(filetype='csv', _likelihood=0)
+        r = _sniffed_dialects.get(line)
+        if r is None:
+            dialect = csv.Sniffer().sniff(line)
+            r = dict(filetype='csv', _likelihood=0)
 
-        for csvopt in dir(dialect):
-            if not csvopt.startswith('_'):
-                r['csv_'+csvopt] = getattr(dialect, csvopt)
+            for csvopt in dir(dialect):
+                if not csvopt.startswith('_'):
+                    r['csv_'+csvopt] = getattr(dialect, csvopt)
+            _sniffed_dialects[line] = r
 
-        return r
+        return dict(r)  # copy; the caller annotates and consumes it
 
 @VisiData.api
 def open_csv(vd, p):
@@ -54,11 +58,11 @@ class CsvSheet(SequenceSheet):
 
             while True:
                 try:
-                    yield next(rdr)
+                    yield from rdr  # the C tokenizer drives the whole loop, instead of a try/next per row
                 except csv.Error as e:
                     e.stacktrace=stacktrace()
                     yield [TypedExceptionWrapper(None, exception=e)]
-                except StopIteration:
+                else:
                     return
 
 
@@ -75,9 +79,14 @@ def save_csv(vd, p, sheet):
             cw.writerow(colnames)
 
         with Progress(gerund='saving', total=sheet.nRows) as prog:
+            batch = []
             for dispvals in sheet.iterdispvals(format=True):
-                cw.writerow(dispvals.values())
+                batch.append(list(dispvals.values()))
                 prog.addProgress(1)
+                if len(batch) >= 1000:
+                    cw.writerows(batch)  # the C writer loops over the whole batch
+                    batch.clear()
+            cw.writerows(batch)
 
 vd.addGlobals({
     'CsvSheet': CsvSheet
@@ -1,5 +1,7 @@
 from visidata import VisiData, vd, Sheet, Path, Column, ItemColumn, BaseSheet
 
+vd.option('h5_rdcc_nbytes', 64*2**20, 'size in bytes of the per-dataset HDF5 chunk cache', replay=True)
+
 @VisiData.api
 def open_h5(vd, p):
     return Hdf5ObjSheet(p.base_stem, source=p)
@@ -12,7 +14,10 @@ class Hdf5ObjSheet(Sheet):
         h5py = vd.importExternal('h5py')
         source = self.source
         if isinstance(self.source, Path):
-            source = h5py.File(str(self.source), 'r')
+            # libver='latest' uses the faster metadata layout for traversal;
+            # a bigger chunk cache keeps recently-decompressed chunks around while scrolling
+            source = h5py.File(str(self.source), 'r', libver='latest',
+                               rdcc_nbytes=self.options.h5_rdcc_nbytes, rdcc_nslots=1024)
 
         self.columns = []
         if isinstance(source, h5py.Group):
@@ -30,22 +35,43 @@ class Hdf5ObjSheet(Sheet):
                 if source.dtype.names:
                     for i, colname in enumerate(source.dtype.names):
                         self.addColumn(ItemColumn(colname, colname), index=i)
-                    yield from source  # copy
+                    yield from self.iter_dataset(source)
                 else:
                     self.addColumn(ItemColumn(source.name, 0))
-                    for v in source:
+                    for v in self.iter_dataset(source):
                         yield [v]
             elif len(source.shape) == 2:  # matrix
                 ncols = source.shape[1]
                 for i in range(ncols):
                     self.addColumn(ItemColumn('', i, width=8), index=i)
                 self.recalc()
-                yield from source  # copy
+                yield from self.iter_dataset(source)
             else:
                 vd.fail('too many dimensions in shape %s' % str(source.shape))
         else:
             vd.fail('unknown h5 object type %s' % type(source))
 
+    def iter_dataset(self, ds):
+        'Generate rows of Dataset *ds*.  Contiguous unfiltered datasets are memory-mapped directly, avoiding a copy through h5py and paging data in on demand.'
+        numpy = vd.importExternal('numpy')
+
+        if not ds.shape[0]:
+            return
+
+        offset = ds.id.get_offset()  # None unless contiguous and allocated
+        if offset is not None and not ds.dtype.hasobject:
+            try:
+                # copy-on-write: rows stay editable in memory without touching the file
+                yield from numpy.memmap(ds.file.filename, mode='c', dtype=ds.dtype, offset=offset, shape=ds.shape)
+                return
+            except (OSError, ValueError):  # e.g. non-local or split file; read through h5py instead
+                pass
+
+        # one h5py read per chunk of rows, not per row; each slice decompresses at most one chunk
+        batchlen = ds.chunks[0] if ds.chunks else 1024
+        for i in range(0, ds.shape[0], batchlen):
+            yield from ds[i:i+batchlen]
+
 
     def openRow(self, row):
         h5py = vd.importExternal('h5py')
@@ -10,11 +10,9 @@ vd.option('default_colname', '', 'column name to use for non-dict rows')
 
 @VisiData.api
 def guess_json(vd, p):
-    with p.open(encoding=vd.options.encoding) as fp:
-        try:
-            line = next(fp)
-        except StopIteration:
-            return
+    line = p.read_prefix().lstrip().partition('\n')[0]
+    if not line:
+        return
 
     line = line.strip()
 
@@ -43,15 +41,33 @@ class JsonSheet(Sheet):
         super().resetCols()
 
     def iterload(self):
+        try:
+            import orjson  # optional, for faster parsing
+        except ImportError:
+            orjson = None
+
+        if orjson:
+            def loads(s):
+                try:
+                    return orjson.loads(s)
+                except ValueError:  # orjson rejects some of what stdlib accepts (NaN, huge ints)
+                    return json.loads(s, object_hook=AttrDict)
+        else:
+            def loads(s):
+                return json.loads(s, object_hook=AttrDict)
+
         with self.open_text_source() as fp:
             for L in fp:
                 L = L.strip()
                 try:
                     if not L: # skip blank lines
                         continue
-                    ret = json.loads(L, object_hook=AttrDict)
+                    ret = loads(L)
                     if isinstance(ret, list):
-                        yield from ret
+                        for r in ret:
+                            yield AttrDict(r) if type(r) is dict else r
+                    elif type(ret) is dict:
+                        yield AttrDict(ret)
                     else:
                         yield ret
 
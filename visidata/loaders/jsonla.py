@@ -17,11 +17,9 @@ def guess_jsonla(vd, p):
     If no suitable header is found, fall back to generic JSON load.
     '''
 
-    with p.open(encoding=vd.options.encoding) as fp:
-        try:
-            first_line = next(fp)
-        except StopIteration:
-            return
+    first_line = p.read_prefix().partition('\n')[0]
+    if not first_line:
+        return
 
     if first_line.strip().startswith('['):
         try:
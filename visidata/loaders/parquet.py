@@ -40,12 +40,34 @@ class ParquetSheet(Sheet):
         for i in range(self.tbl.num_rows):
             yield dict(__rownum__=i)
 
+    def unmodifiedTable(self):
+        'Return the source pyarrow Table if the sheet still mirrors it exactly (no edits, deletions, reordering, or column changes), else None.'
+        tbl = getattr(self, 'tbl', None)
+        if tbl is None:
+            return None
+        if [c.name for c in self.visibleCols] != list(tbl.column_names):
+            return None
+        from visidata.loaders.arrow import arrow_to_vdtype
+        if any(c.type != arrow_to_vdtype(tblcol.type) for c, tblcol in zip(self.visibleCols, tbl.columns)):
+            return None  # a column was retyped; the generic writer must apply it
+        if self.nRows != tbl.num_rows:
+            return None
+        if any(len(r) != 1 or r['__rownum__'] != i for i, r in enumerate(self.rows)):
+            return None
+        return tbl
+
 
 @VisiData.api
 def save_parquet(vd, p, sheet):
     pa = vd.importExternal("pyarrow")
     pq = vd.importExternal("pyarrow.parquet", "pyarrow")
 
+    if isinstance(sheet, ParquetSheet) and sheet.unmodifiedTable() is not None:
+        # write the source table back without rebuilding arrays row by row
+        with p.open_bytes(mode="w") as outf:
+            pq.write_table(sheet.tbl, outf)
+        return
+
     typemap = {
         anytype: pa.string(),
         int: pa.int64(),
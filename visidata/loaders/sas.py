@@ -1,5 +1,3 @@
-import logging
-
 from visidata import VisiData, Sheet, Progress, ColumnItem, anytype, vd
 
 SASTypes = {
@@ -32,6 +30,7 @@ class XptSheet(Sheet):
 
 class SasSheet(Sheet):
     def iterload(self):
+        import logging
         sas7bdat = vd.importExternal('sas7bdat')
         self.dat = sas7bdat.SAS7BDAT(str(self.source), skip_header=True, log_level=logging.CRITICAL)
         self.columns = []
@@ -14,12 +14,19 @@ vd.option('tsv_safe_newline', '\u001e', 'replacement for newline character when
 vd.option('tsv_safe_tab', '\u001f', 'replacement for tab character when saving to tsv', replay=True)
 
 
+@VisiData.api
+def guess_tsv(vd, p):
+    line = p.read_prefix().partition('\n')[0]
+    if '\t' in line:
+        return dict(filetype='tsv', _likelihood=0)
+
+
 @VisiData.api
 def open_tsv(vd, p):
     return TsvSheet(p.base_stem, source=p)
 
 
-def adaptive_bufferer(fp, max_buffer_size=65536):
+def adaptive_bufferer(fp, max_buffer_size=1048576):
     """Loading e.g. tsv files goes faster with a large buffer. But when the input stream
     is slow (e.g. 1 byte/second) and the buffer size is large, it can take a long time until
     the buffer is filled. Only when the buffer is filled (or the input stream is finished)
@@ -88,17 +95,29 @@ class TsvSheet(SequenceSheet):
 
         with self.open_text_source() as fp:
                 regex_skip = getattr(fp, '_regex_skip', None)
-                for line in splitter(adaptive_bufferer(fp), rowdelim):
-                    if not line or (regex_skip and regex_skip.match(line)):
-                        continue
-
-                    row = line.split(delim)
+                buf = ''
+                for chunk in adaptive_bufferer(fp):
+                    buf += chunk
+                    *lines, buf = buf.split(rowdelim)
+                    yield from self.splitRows(lines, delim, regex_skip)
+
+                buf = buf.rstrip(rowdelim)  # trim empty trailing lines
+                if buf:
+                    yield from self.splitRows(buf.split(rowdelim), delim, regex_skip)
+
+    def splitRows(self, lines, delim, regex_skip=None):
+        'Split a batch of *lines* on *delim* in one bulk pass, padding short rows.'
+        if regex_skip:
+            lines = [line for line in lines if line and not regex_skip.match(line)]
+        else:
+            lines = [line for line in lines if line]
 
-                    if len(row) < self.nVisibleCols:
-                        # extend rows that are missing entries
-                        row.extend([None]*(self.nVisibleCols-len(row)))
+        for row in [line.split(delim) for line in lines]:
+            if len(row) < self.nVisibleCols:
+                # extend rows that are missing entries
+                row.extend([None]*(self.nVisibleCols-len(row)))
 
-                    yield row
+            yield row
 
 
 @VisiData.api
@@ -120,9 +139,14 @@ def save_tsv(vd, p, vs, delimiter='', row_delimiter=''):
         colhdr = unitsep.join(col.name.translate(trdict) for col in vs.visibleCols) + rowsep
         fp.write(colhdr)
 
+        batch = []
         for dispvals in vs.iterdispvals(format=True):
-            fp.write(unitsep.join(dispvals.values()))
-            fp.write(rowsep)
+            batch.append(unitsep.join(dispvals.values()))
+            batch.append(rowsep)
+            if len(batch) >= 2000:  # write 1000 rows at a time
+                fp.write(''.join(batch))
+                batch.clear()
+        fp.write(''.join(batch))
 
 
 @Sheet.api
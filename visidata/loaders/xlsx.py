@@ -41,10 +41,14 @@ class XlsxIndexSheet(IndexSheet):
 
 
 class XlsxSheet(SequenceSheet):
-    # rowdef: AttrDict of column_letter to cell
+    # rowdef: AttrDict of column_letter to cell (or to plain value, when _values_only)
+    _values_only = False  # set during load: no Cell objects needed for colors or meta columns
     colorizers = [
         CellColorizer(5, None, lambda s,c,r,v: c and r and s.colorize_xlsx_cell(c,r))
     ]
+    def cellExpr(self, column_letter):
+        return column_letter if self._values_only else column_letter + '.value'
+
     def setCols(self, headerrows):
         vd.importExternal('openpyxl')
         from openpyxl.utils.cell import get_column_letter
@@ -54,7 +58,7 @@ class XlsxSheet(SequenceSheet):
         if not headerrows:
             return
 
-        headers = [[cell.value for cell in row.values()] for row in headerrows]
+        headers = [[getattr(cell, 'value', cell) for cell in row.values()] for row in headerrows]
         column_letters = [
                 x.column_letter if 'column_letter' in dir(x)
                 else get_column_letter(i+1)
@@ -63,20 +67,23 @@ class XlsxSheet(SequenceSheet):
         for i, colnamelines in enumerate(itertools.zip_longest(*headers, fillvalue='')):
             colnamelines = ['' if c is None else c for c in colnamelines]
             column_name = ''.join(map(str, colnamelines))
-            self.addColumn(AttrColumn(column_name, column_letters[i] + '.value', column_letter=column_letters[i]))
+            self.addColumn(AttrColumn(column_name, self.cellExpr(column_letters[i]), column_letter=column_letters[i]))
             self.addXlsxMetaColumns(column_letters[i], column_name)
 
     def addRow(self, row, index=None):
         Sheet.addRow(self, row, index=index)  # skip SequenceSheet
         for column_letter, v in list(row.items())[len(self.columns):len(row)]:  # no-op if already done
-            self.addColumn(AttrColumn('', column_letter + '.value'))
+            self.addColumn(AttrColumn('', self.cellExpr(column_letter)))
             self.addXlsxMetaColumns(column_letter, column_letter)
 
     def iterload(self):
         vd.importExternal('openpyxl')
         from openpyxl.utils.cell import get_column_letter
         worksheet = self.source
-        for row in Progress(worksheet.iter_rows(), total=worksheet.max_row or 0):
+        # Cell objects are only needed for cell colors and the meta columns;
+        # otherwise let openpyxl skip constructing them entirely
+        self._values_only = not (self.options.xlsx_color_cells or self.options.xlsx_meta_columns)
+        for row in Progress(worksheet.iter_rows(values_only=self._values_only), total=worksheet.max_row or 0):
             yield AttrDict({get_column_letter(i+1): cell for i, cell in enumerate(row)})
 
     def addXlsxMetaColumns(self, column_letter, column_name):
@@ -94,7 +101,8 @@ class XlsxSheet(SequenceSheet):
                            getter=lambda c,r: c.sheet.colorize_xlsx_cell(c,r)))
 
     def paste_after(self, rowidx):
-        to_paste = list(copy.copy(r) for r in reversed(vd.memory.cliprows))
+        # rows are AttrDicts, for which the dict constructor is much faster than generic copy.copy
+        to_paste = [AttrDict(r) if isinstance(r, dict) else copy.copy(r) for r in reversed(vd.memory.cliprows)]
         self.addRows(to_paste, index=rowidx)
 
 
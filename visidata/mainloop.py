@@ -220,14 +220,16 @@ def mainloop(vd, scr):
             pass
         elif keystroke == 'Ctrl+Q':
             return vd.lastErrors and '\n'.join(vd.lastErrors[-1])
-        elif vd.bindkeys._get(vd.keystrokes) is not None:
-            sheet.execCommand(vd.keystrokes, keystrokes=vd.keystrokes)
-            prefixWaiting = False
-        elif vd.keystrokes in vd.allPrefixes:
-            prefixWaiting = True
         else:
-            vd.status('no command for "%s"' % (vd.keystrokes))
-            prefixWaiting = False
+            cmd = sheet.getCommand(vd.keystrokes)  # resolve binding and command in one pass
+            if cmd:
+                sheet.execCommand(cmd, keystrokes=vd.keystrokes)
+                prefixWaiting = False
+            elif vd.keystrokes in vd.allPrefixes:
+                prefixWaiting = True
+            else:
+                vd.status('no command for "%s"' % (vd.keystrokes))
+                prefixWaiting = False
 
         # play next queued command
         if vd._nextCommands and not vd.unfinishedThreads:
@@ -229,6 +229,15 @@ class Path(os.PathLike):
             return self._path.__lt__(a._path)
         return self._path.__lt__(a)
 
+    def __eq__(self, a):
+        'Two Paths wrapping the same pathname are equal, so caches keyed by Path (like stat) hit across instances.'
+        if isinstance(a, Path):
+            return self._path == a._path
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._path)
+
     def __truediv__(self, a):
         return Path(self._path.__truediv__(a))
 
@@ -310,6 +319,20 @@ class Path(os.PathLike):
         else:
             return self._path.read_text(*args, **kwargs)
 
+    def read_prefix(self, n=65536):
+        'Return roughly the first *n* characters of the file, decoded; cached until the file mtime changes.  For cheap repeated sniffing by the filetype guessers.'
+        mtime = getattr(self.stat(), 'st_mtime_ns', None)
+        cached = self.__dict__.get('_prefix_cache')
+        if cached is not None:
+            cached_mtime, cached_n, text = cached
+            if cached_mtime == mtime and (cached_n >= n or len(text) < cached_n):  # big enough, or the whole file
+                return text[:n]
+
+        with self.open() as fp:
+            text = fp.read(n)
+        self.__dict__['_prefix_cache'] = (mtime, n, text)
+        return text
+
     @wraps(pathlib.Path.open)
     def _open(self, *args, **kwargs):
         if self.fp:
@@ -377,11 +400,19 @@ class Path(os.PathLike):
     def stat(self, force=False):
         'Return Path.stat() if relevant.'
         try:
+            st = self.__dict__.get('_stat_result')  # seeded by seed_stat
+            if st is not None and not force:
+                return st
             if not self.is_url():
                 return self._path.stat()
         except Exception as e:
             return None
 
+    def seed_stat(self, st):
+        'Record already-known os.stat_result *st* (e.g. from a scandir DirEntry), to avoid a redundant stat syscall.'
+        self.__dict__['_stat_result'] = st
+        return self
+
     @wraps(pathlib.Path.exists)
     def exists(self):
         'Return True if the path can be opened.'
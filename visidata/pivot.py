@@ -222,11 +222,18 @@ class PivotSheet(Sheet):
         # group rows by their keys (groupByCols), and separate by their pivot values (pivotCols)
         groups = {}  # [formattedDiscreteKeys] -> (numericGroupRows:dict(formattedNumericKeyRange -> PivotGroupRow), groupRow:PivotGroupRow)  # groupRow is main/error row
 
-        for sourcerow in Progress(self.source.iterrows(), 'grouping', total=self.source.nRows):
-            discreteKeys = list(forward(origcol.getTypedValue(sourcerow)) for origcol in discreteCols)
+        pivotCols = self.pivotCols
 
-            # wrapply will pass-through a key-able TypedWrapper
-            formattedDiscreteKeys = tuple(wrapply(c.format, v) for v, c in zip(discreteKeys, discreteCols))
+        for sourcerow in Progress(self.source.iterrows(), 'grouping', total=self.source.nRows):
+            # extract and format each key in a single pass over discreteCols
+            discreteKeys = []
+            formattedDiscreteKeys = []
+            for origcol in discreteCols:
+                v = forward(origcol.getTypedValue(sourcerow))
+                discreteKeys.append(v)
+                # wrapply will pass-through a key-able TypedWrapper
+                formattedDiscreteKeys.append(wrapply(origcol.format, v))
+            formattedDiscreteKeys = tuple(formattedDiscreteKeys)
 
             numericGroupRows, groupRow = groups.get(formattedDiscreteKeys, (None, None))
             if numericGroupRows is None:
@@ -269,7 +276,7 @@ class PivotSheet(Sheet):
             groupRow.sourcerows.append(sourcerow)
 
             # separate by pivot value
-            for col in self.pivotCols:
+            for col in pivotCols:
                 varval = col.getTypedValue(sourcerow)
                 matchingRows = groupRow.pivotrows.get(varval)
                 if matchingRows is None:
@@ -41,12 +41,15 @@ def iterdispvals(sheet, *cols, format=False):
         if trdict:
             transformers[col].append(lambda v,trdict=trdict: v.translate(trdict))
 
+    # bind the value getters once, instead of an attribute lookup per cell
+    colgetters = [(col, col.getValue, transforms) for col, transforms in transformers.items()]
+
     options_safe_error = sheet.options.safe_error
     for r in Progress(sheet.rows):
         dispvals = collections.OrderedDict()  # [col] -> value
-        for col, transforms in transformers.items():
+        for col, getValue, transforms in colgetters:
             try:
-                dispval = col.getValue(r)
+                dispval = getValue(r)
 
             except Exception as e:
                 vd.exceptionCaught(e)
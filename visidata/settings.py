@@ -16,6 +16,7 @@ class SettingsMgr(collections.OrderedDict):
     def __init__(self):
         super().__init__()
         self.allobjs = {}
+        self._generation = 0  # incremented on every change, to invalidate OptionsObject caches
 
     def __hash__(self):
         return hash(id(self))
@@ -47,12 +48,14 @@ class SettingsMgr(collections.OrderedDict):
         objstr = self.objname(obj)
         if objstr in self[k]:
             del self[k][objstr]
+            self._generation += 1
 
     def set(self, k, v, obj):
         'obj is a Sheet instance, or a Sheet [sub]class.  obj="global" means override default unless there is a sheet-specific override; obj="default" means last resort.'
         if k not in self:
             self[k] = dict()
         self[k][self.objname(obj)] = v
+        self._generation += 1
         return v
 
     def setdefault(self, k, v):
@@ -113,6 +116,13 @@ class Command:
         self.helpstr = helpstr
         self.module = module
         self.deprecated = deprecated
+        self._code = None  # compiled execstr, cached on first execution
+
+    @property
+    def code(self):
+        if self._code is None:
+            self._code = compile(self.execstr, self.longname, 'exec')
+        return self._code
 
 
 class Option:
@@ -140,6 +150,7 @@ class OptionsObject:
     def __init__(self, mgr, obj=None):
         object.__setattr__(self, '_opts', mgr)
         object.__setattr__(self, '_cache', {})
+        object.__setattr__(self, '_generation', mgr._generation)
         object.__setattr__(self, '_obj', obj)
 
     def keys(self, obj=None):
@@ -149,6 +160,9 @@ class OptionsObject:
 
     def _get(self, k, obj=None):
         'Return Option object for k in context of obj. Cache result until any set().'
+        if self._generation != self._opts._generation:  # some option changed somewhere
+            self._cache.clear()
+            object.__setattr__(self, '_generation', self._opts._generation)
         opt = self._cache.get((k, obj or vd.activeSheet), None)
         if opt is None:
             opt = self._opts._get(k, obj)
@@ -159,7 +173,10 @@ class OptionsObject:
         k, v = vd._resolve_optalias(k, v)  # to set deprecated and abbreviated options
 
         opt = self._get(k) or Option(k, v, '', module)
-        self._cache.clear()  # invalidate entire cache on any change
+        # the _generation bump in SettingsMgr.set invalidates every OptionsObject cache
+        colors = getattr(visidata, 'colors', None)
+        if colors is not None:
+            colors.colorcache.clear()  # resolved theme colors may depend on the changed option
         return self._opts.set(k, Option(k, v, opt.helpstr or helpstr, opt.module or module), obj)
 
     def is_set(self, k, obj=None):
@@ -225,7 +242,9 @@ class OptionsObject:
         opt = self._get(optname)
         if vd.cmdlog and opt and opt.replayable:
             self.add_option_to_cmdlogs(obj, optname, value='', longname='unset-option')
-        self._cache.clear()  # invalidate entire cache on any change
+        colors = getattr(visidata, 'colors', None)
+        if colors is not None:
+            colors.colorcache.clear()
         return v
 
     def add_option_to_cmdlogs(self, obj, optname, value='', longname='set-option'):
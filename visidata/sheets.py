@@ -174,6 +174,7 @@ class TableSheet(BaseSheet):
         # as computed during draw()
         self._rowLayout = {}      # [rowidx] -> (y, w)
         self._visibleColLayout = {}      # [vcolidx] -> (x, w)
+        self._orderedColLayout = []      # (vcolidx, x, w, col) in display order
 
         # list of all columns in display order
         self.initialCols = kwargs.pop('columns', None) or type(self).columns
@@ -663,6 +664,11 @@ class TableSheet(BaseSheet):
 
         self.rightVisibleColIndex = vcolidx
 
+        # pre-sort and pre-fetch the columns once per layout, instead of per row drawn
+        vcols = self.availCols
+        self._orderedColLayout = [(vcolidx, x, w, vcols[vcolidx])
+                                    for vcolidx, (x, w) in sorted(self._visibleColLayout.items())]
+
     def calcSingleColLayout(self, col:Column, vcolidx:int, x:int=0, minColWidth:int=4):
             if col.width is None and len(self.visibleRows) > 0:
                 vrows = self.visibleRows if self.nRows > 1000 else self.rows[:1000]  #1964
@@ -782,7 +788,7 @@ class TableSheet(BaseSheet):
         vcolidx = 0
 
         headerRow = 0
-        for vcolidx, colinfo in sorted(self._visibleColLayout.items()):
+        for vcolidx, x, colwidth, col in self._orderedColLayout:
             self.drawColHeader(scr, headerRow, numHeaderRows, vcolidx)
 
         y = headerRow + numHeaderRows
@@ -806,19 +812,21 @@ class TableSheet(BaseSheet):
             if displines is None:
                 displines = {}  # [vcolidx] -> list of lines in that cell
 
-            for vcolidx, (x, colwidth) in sorted(self._visibleColLayout.items()):
-                if x < self.windowWidth:  # only draw inside window
-                    vcols = self.availCols
-                    if vcolidx >= self.nVisibleCols and vcolidx != self.cursorVisibleColIndex:
+            winwidth = self.windowWidth
+            nvisible = self.nVisibleCols
+            cursorvcolidx = self.cursorVisibleColIndex
+            disp_note_none = self.options.disp_note_none
+            for vcolidx, x, colwidth, col in self._orderedColLayout:
+                if x < winwidth:  # only draw inside window
+                    if vcolidx >= nvisible and vcolidx != cursorvcolidx:
                         continue
-                    col = vcols[vcolidx]
                     cellval = col.getCell(row)
 
                     cellval.display = col.display(cellval, colwidth)
 
                     try:
                         if isNull and isNull(cellval.value):
-                            cellval.note = self.options.disp_note_none
+                            cellval.note = disp_note_none
                             cellval.notecolor = 'color_note_type'
                     except (TypeError, ValueError):
                         pass
@@ -1020,8 +1028,7 @@ def push(vd, vs, pane=0, load=True):
     if not isinstance(vs, BaseSheet):
         return  # return instead of raise, some commands need this
 
-    if vs in vd.sheets:
-        vd.sheets.remove(vs)
+    vd.sheets[:] = [s for s in vd.sheets if s is not vs]  # remove from other position in a single pass, if already on sheets stack
 
     vs.vd = vd
     if pane == -1:
@@ -188,23 +188,40 @@ class DirSheet(Sheet):
         hidden_files = self.options.dir_hidden
 
         def _walkfiles(p, dir_depth:int=0):
-            basepath = str(p)
-            for folder, subdirs, files in os.walk(basepath):
-                subfolder = folder[len(basepath)+1:]
-                if not hidden_files and subfolder.startswith('.'): continue
-                if subfolder in ['.', '..']: continue
-
-                fpath = Path(folder)
-                if str(fpath) != str(p):
-                    yield fpath
-
-                for fn in files:
-                    yield fpath/fn
-
-                if dir_depth < len(fpath.parents)-len(p.parents)+1:
-                    for d in subdirs:
-                        yield fpath/d
-                    subdirs.clear()
+            def _scan(folder, subfolder, depth):
+                'Yield Paths under *folder* (at *depth* below the base), with stats seeded from scandir.'
+                if not hidden_files and subfolder.startswith('.'): return
+                if subfolder in ['.', '..']: return
+
+                if subfolder:
+                    yield Path(folder)
+
+                subdirs = []
+                try:
+                    with os.scandir(folder) as it:
+                        for e in it:
+                            if e.is_dir():
+                                subdirs.append(e)
+                            else:
+                                fpath = Path(e.path)
+                                with contextlib.suppress(OSError):
+                                    fpath.seed_stat(e.stat())
+                                yield fpath
+                except OSError:  # unreadable or vanished directory; skip it, as os.walk does
+                    return
+
+                if depth >= dir_depth:
+                    for e in subdirs:
+                        dpath = Path(e.path)
+                        with contextlib.suppress(OSError):
+                            dpath.seed_stat(e.stat())
+                        yield dpath
+                else:
+                    for e in subdirs:
+                        if not e.is_symlink():  # as with os.walk(followlinks=False)
+                            yield from _scan(e.path, os.path.join(subfolder, e.name), depth+1)
+
+            yield from _scan(str(p), '', 0)
 
         basepath = str(self.source)
 
@@ -65,10 +65,18 @@ def sort(self):
     try:
         with Progress(gerund='sorting', total=self.nRows) as prog:
             # replace ambiguous colname strings with unambiguous Column objects  #2494
-            self._ordering = self.ordering
-            def _sortkey(r):
-                prog.addProgress(1)
-                return self.sortkey(r, ordering=self._ordering)
+            self._ordering = ordering = self.ordering
+            if len(ordering) == 1 and not ordering[0][1]:
+                # common case: single ascending column; skip the per-row list and Reversor
+                getTypedValue = ordering[0][0].getTypedValue
+                def _sortkey(r):
+                    prog.addProgress(1)
+                    return getTypedValue(r)
+            else:
+                sortkey = self.sortkey
+                def _sortkey(r):
+                    prog.addProgress(1)
+                    return sortkey(r, ordering=ordering)
 
             # must not reassign self.rows: use .sort() instead of sorted()
             self.rows.sort(key=_sortkey)
@@ -83,7 +83,7 @@ def statuses(vd):
 
 @VisiData.lazy_property
 def statusHistory(vd):
-    return list()  # list of [priority, statusmsg, repeats] for all status messages ever
+    return collections.deque(maxlen=1000)  # deque of [priority, statusmsg, repeats, source] for recent status messages; oldest evicted first
 
 @VisiData.api
 def getStatusSource(vd):
@@ -272,7 +272,7 @@ class StatusSheet(Sheet):
 
 @VisiData.property
 def statusHistorySheet(vd):
-    return StatusSheet("status_history", source=vd.statusHistory[::-1])  # in reverse order
+    return StatusSheet("status_history", source=list(reversed(vd.statusHistory)))  # in reverse order
 
 
 BaseSheet.addCommand('^P', 'open-statuses', 'vd.push(vd.statusHistorySheet)', 'open Status History')
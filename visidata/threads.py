@@ -1,4 +1,3 @@
-import ctypes
 import time
 import os.path
 import functools
@@ -85,6 +84,7 @@ def Progress(vd, iterable=None, gerund="", total=None, sheet=None):
 @VisiData.api
 def cancelThread(vd, *threads, exception=EscapeException):
     'Raise *exception* in one or more *threads*.'
+    import ctypes
     for t in threads:
         if t.ident is not None:
             ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_long(t.ident), ctypes.py_object(exception))